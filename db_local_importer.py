@@ -1,10 +1,379 @@
 import os
+import json
+import queue
+import atexit
+import zlib
+import errno
+import ntpath
 import shutil
 import logging
+import logging.handlers
 import argparse
+import multiprocessing
+from contextlib import contextmanager
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dotenv import load_dotenv
-import win32com.client
-import pythoncom
+
+# Buffer de copia de 1 MiB: el valor por defecto (64 KiB) penaliza mucho las
+# copias sobre SMB. Afecta a todas las rutas que acaban en shutil.copyfileobj.
+COPY_BUFFER_SIZE = 1024 * 1024
+shutil.COPY_BUFSIZE = COPY_BUFFER_SIZE
+
+# Filas leídas por cada fetchmany al copiar registros
+FETCH_BATCH_SIZE = 500
+
+LOGGER_NAME = 'DBLocalImporter'
+
+ACCESS_ODBC_DRIVER = '{Microsoft Access Driver (*.mdb, *.accdb)}'
+
+# ERROR_BAD_NETPATH y ERROR_BAD_NET_NAME: el servidor o el recurso compartido no existen
+_NETWORK_NAME_ERRORS = frozenset({53, 67})
+
+# Tipos ODBC de texto con longitud y equivalencias directas en Access SQL
+_TEXT_TYPES = frozenset({'VARCHAR', 'CHAR', 'TEXT'})
+_TYPE_MAPPING = {
+    'COUNTER': 'AUTOINCREMENT',
+    'INTEGER': 'INTEGER',
+    'LONG': 'LONG',
+    'SINGLE': 'SINGLE',
+    'DOUBLE': 'DOUBLE',
+    'CURRENCY': 'CURRENCY',
+    'DATETIME': 'DATETIME',
+    'BIT': 'YESNO',
+    'BYTE': 'BYTE',
+    'LONGBINARY': 'LONGBINARY',
+    'LONGTEXT': 'MEMO'
+}
+
+# Clave de la ruta de la base de datos enlazada dentro de TableDef.Connect
+_DATABASE_KEY = 'DATABASE='
+
+
+@dataclass(frozen=True)
+class DBEntry:
+    """Base de datos configurada, con sus datos derivados ya calculados."""
+    name: str
+    remote: str
+    local: str
+    filename: str
+    is_correos: bool
+
+
+def _fast_copy(src: str, dst: str):
+    """Copia un fichero usando la copia nativa del sistema y conserva sus metadatos."""
+    if os.name == 'nt':
+        try:
+            import win32file
+        except ImportError:
+            _buffered_copy(src, dst)
+        else:
+            # CopyFileW evita el bucle de lectura/escritura en espacio de usuario
+            # y permite la copia en servidor sobre recursos SMB
+            win32file.CopyFile(src, dst, False)
+    elif hasattr(os, 'copy_file_range'):
+        try:
+            _kernel_copy(src, dst)
+        except OSError as e:
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EOPNOTSUPP, errno.EINVAL):
+                raise
+            shutil.copyfile(src, dst)
+    else:
+        # shutil.copyfile ya delega en sendfile/fcopyfile cuando es posible
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _kernel_copy(src: str, dst: str):
+    """Copia con copy_file_range: clonado de bloques en CoW o copia en servidor NFS."""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = remaining = os.fstat(fsrc.fileno()).st_size
+        
+        while remaining > 0:
+            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if copied == 0:
+                if remaining == size:
+                    # Algunos sistemas de ficheros devuelven 0 en vez de un error:
+                    # _fast_copy recurre entonces a la copia normal
+                    raise OSError(errno.ENOSYS, "copy_file_range no copió ningún byte", src)
+                # No dar por buena una copia truncada (p. ej. el origen encogió)
+                raise OSError(errno.EIO, f"Copia incompleta: faltan {remaining} bytes", src)
+            remaining -= copied
+
+
+def _buffered_copy(src: str, dst: str):
+    """Copia un fichero en bloques grandes cuando no hay copia nativa disponible."""
+    # Buffer explícito: en Python 3.7 shutil ignora COPY_BUFSIZE y usa 16 KiB
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+
+
+def _edge_crc32(path: str, chunk_size: int = COPY_BUFFER_SIZE) -> int:
+    """CRC32 del primer y último bloque de un fichero (comparación rápida de contenido)."""
+    # seek + read en lugar de os.pread, que no existe en Windows
+    with open(path, 'rb') as f:
+        crc = zlib.crc32(f.read(chunk_size))
+        size = os.fstat(f.fileno()).st_size
+        if size > chunk_size:
+            f.seek(max(chunk_size, size - chunk_size))
+            crc = zlib.crc32(f.read(chunk_size), crc)
+    return crc
+
+
+# Pool de conexiones ODBC del proceso (pyodbc solo lo aplica antes de la primera conexión)
+_odbc_pooling = True
+
+
+def _import_pyodbc():
+    """Importa pyodbc bajo demanda con el pool de conexiones ODBC del proceso."""
+    import pyodbc
+    
+    # Debe fijarse antes de la primera conexión; las cadenas de conexión se
+    # construyen siempre igual (_odbc_connection_string) para que el pool las reutilice
+    pyodbc.pooling = _odbc_pooling
+    return pyodbc
+
+
+def _unc_share(path: str) -> str:
+    """Devuelve el recurso compartido UNC (\\\\servidor\\recurso) de una ruta, o '' si no es UNC."""
+    drive = ntpath.normcase(ntpath.splitdrive(path)[0])
+    return drive if drive.startswith('\\\\') else ''
+
+
+def _probe_share(share: str):
+    """
+    Sondea un recurso UNC
+    
+    Returns:
+        True si responde, False si el servidor o el recurso no existen,
+        None si no se puede saber (p. ej. raíz del recurso restringida)
+    """
+    try:
+        os.stat(share)
+        return True
+    except OSError as e:
+        if getattr(e, 'winerror', None) in _NETWORK_NAME_ERRORS:
+            return False
+        return None
+
+
+class _RecordCollector(logging.Handler):
+    """Acumula los registros de log de un proceso hijo para reenviarlos al padre."""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        # Formatear el mensaje ya para que el registro se pueda serializar
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+@contextmanager
+def _captured_logs():
+    """Redirige el logger del importador a un colector mientras dura el bloque."""
+    logger = logging.getLogger(LOGGER_NAME)
+    saved_handlers, saved_level = logger.handlers[:], logger.level
+    collector = _RecordCollector()
+    logger.handlers = [collector]
+    logger.setLevel(logging.DEBUG)
+    
+    try:
+        yield collector.records
+    finally:
+        logger.handlers = saved_handlers
+        logger.setLevel(saved_level)
+
+
+def _copy_correos_worker(importer, entry: DBEntry) -> tuple:
+    """Punto de entrada del proceso hijo que genera la base de correos ligera."""
+    global _odbc_pooling
+    # Cada base se abre una sola vez: sin pool, close() libera de verdad la copia .src
+    _odbc_pooling = False
+    
+    with _captured_logs() as records:
+        ok = importer._copy_correos(entry)
+    
+    return ok, records
+
+
+def _update_links_worker(task: tuple) -> tuple:
+    """Punto de entrada de los procesos hijo: actualiza los vínculos de un lote de bases."""
+    db_items, password, local_paths, local_db_dir = task
+    logger = logging.getLogger(LOGGER_NAME)
+    results = []
+    
+    with _captured_logs() as records:
+        try:
+            _update_links_batch(db_items, password, local_paths, local_db_dir, results)
+        except Exception as e:
+            # Nunca dejar escapar el error: se perderían los registros y los demás lotes
+            logger.error("[X] Error en el proceso de actualización de vínculos: %s", e)
+        
+        # Las bases que no llegaron a procesarse cuentan como fallidas
+        done = {db_name for db_name, _ in results}
+        results.extend((db_name, False) for db_name, _ in db_items if db_name not in done)
+    
+    return results, records
+
+
+def _update_links_batch(db_items: list, password: str, local_paths: dict, local_db_dir: str, results: list):
+    """Actualiza los vínculos de un lote de bases con una única instancia de Access."""
+    import pythoncom
+    import win32com.client
+    
+    logger = logging.getLogger(LOGGER_NAME)
+    pythoncom.CoInitialize()
+    access = None
+    
+    try:
+        try:
+            # Una sola instancia de Access por proceso para todo el lote
+            access = win32com.client.Dispatch("Access.Application")
+            access.Visible = False
+        except Exception as e:
+            logger.error("[X] No se pudo iniciar Microsoft Access: %s", e)
+            access = None
+        
+        for db_name, db_path in db_items:
+            logger.info("[LINK] Actualizando vínculos en %s...", db_name)
+            try:
+                ok = access is not None and _update_database_links(
+                    access, db_path, password, local_paths, local_db_dir
+                )
+            except Exception as e:
+                logger.error("[X] Error procesando vínculos en %s: %s", db_name, e)
+                ok = False
+            
+            if ok:
+                logger.info("  [OK] Vínculos actualizados en %s", db_name)
+            else:
+                logger.error("  [X] Error actualizando vínculos en %s", db_name)
+            results.append((db_name, ok))
+    finally:
+        if access is not None:
+            try:
+                access.Quit()
+            except Exception as e:
+                # Access pudo caerse a mitad del lote: los resultados ya están registrados
+                logger.warning("  [!] No se pudo cerrar Microsoft Access: %s", e)
+            access = None
+        pythoncom.CoUninitialize()
+
+
+def _update_database_links(access, db_path: str, password: str, local_paths: dict, local_db_dir: str) -> bool:
+    """Actualiza los vínculos de una base de datos usando una instancia de Access ya abierta"""
+    logger = logging.getLogger(LOGGER_NAME)
+    
+    try:
+        # Abrir base de datos
+        if password:
+            access.OpenCurrentDatabase(db_path, False, password)
+        else:
+            access.OpenCurrentDatabase(db_path)
+    except Exception as e:
+        logger.error("  [X] Error abriendo %s: %s", db_path, e)
+        return False
+    
+    try:
+        db = access.CurrentDb()
+        table_defs = db.TableDefs
+        
+        updated_count = 0
+        pending = []
+        # Muchas tablas apuntan a las mismas pocas bases: resolver cada ruta una vez
+        resolved = {}
+        
+        # Cada acceso a una propiedad COM es una llamada IDispatch: leer lo mínimo.
+        # Iterar la colección usa su enumerador (IEnumVARIANT) en vez de Item(i).
+        for table_def in table_defs:
+            table_name = table_def.Name
+            
+            # Las tablas de sistema y temporales nunca están vinculadas
+            if table_name.startswith(('MSys', '~')):
+                continue
+            
+            # Solo procesar tablas vinculadas
+            connect_str = getattr(table_def, 'Connect', '') or ''
+            if not connect_str:
+                continue
+            
+            # Extraer la ruta actual
+            current_db_path = _linked_database_path(connect_str)
+            if not current_db_path:
+                continue
+            
+            # Convertir a ruta local
+            target = resolved.get(current_db_path)
+            if target is None:
+                new_local_path = _convert_to_local_path(current_db_path, local_paths, local_db_dir)
+                already_local = (os.path.normcase(os.path.abspath(new_local_path))
+                                 == os.path.normcase(os.path.abspath(current_db_path)))
+                target = resolved[current_db_path] = (
+                    new_local_path, already_local, bool(new_local_path) and os.path.exists(new_local_path)
+                )
+            new_local_path, already_local, local_exists = target
+            
+            # Si ya apunta a la copia local no hace falta RefreshLink (abre la base enlazada)
+            if already_local:
+                logger.debug("    [=] Tabla %s ya vinculada a la copia local", table_name)
+                continue
+            
+            if local_exists:
+                try:
+                    # Actualizar el vínculo; el refresco se hace al final en bloque
+                    table_def.Connect = connect_str.replace(current_db_path, new_local_path)
+                    pending.append((table_def, table_name))
+                except Exception as e:
+                    logger.debug("    [X] Error revinculando %s: %s", table_name, e)
+        
+        # Segunda pasada: validar todos los vínculos modificados
+        for table_def, table_name in pending:
+            try:
+                table_def.RefreshLink()
+                
+                logger.debug("    [OK] Tabla %s revinculada", table_name)
+                updated_count += 1
+                
+            except Exception as e:
+                logger.debug("    [X] Error revinculando %s: %s", table_name, e)
+        
+        logger.info("  [OK] %s tablas revinculadas", updated_count)
+        return True
+        
+    except Exception as e:
+        logger.error("  [X] Error actualizando vínculos: %s", e)
+        if logger.isEnabledFor(logging.DEBUG):
+            import traceback
+            logger.debug(traceback.format_exc())
+        return False
+    finally:
+        # Cerrar siempre: la instancia de Access se reutiliza para la siguiente base
+        access.CloseCurrentDatabase()
+
+
+def _linked_database_path(connect_str: str) -> str:
+    """Extrae la ruta DATABASE= de una cadena Connect ('' si no la tiene)"""
+    # Access siempre escribe la clave en mayúsculas; buscar sin distinguir solo si falla
+    _, sep, rest = connect_str.partition(_DATABASE_KEY)
+    if not sep:
+        index = connect_str.upper().find(_DATABASE_KEY)
+        if index < 0:
+            return ''
+        rest = connect_str[index + len(_DATABASE_KEY):]
+    return rest.partition(';')[0]
+
+
+def _convert_to_local_path(remote_path: str, local_paths: dict, local_db_dir: str) -> str:
+    """Convierte una ruta remota a su equivalente local"""
+    filename = os.path.basename(remote_path)
+    
+    # Buscar en nuestras bases de datos configuradas; si no, asumir el directorio local
+    return local_paths.get(filename.lower()) or os.path.join(local_db_dir, filename)
+
 
 class DBLocalImporter:
     """Clase para importar bases de datos de Access a un entorno local."""
@@ -20,6 +389,8 @@ class DBLocalImporter:
         self.remote_base_dir = os.getenv('REMOTE_BASE_DIR')
         self.local_db_dir = os.getenv('LOCAL_DB_DIR')
         self.db_password = os.getenv('DB_PASSWORD')
+        # Comprobar también el contenido (CRC de los extremos) antes de dar una copia por vigente
+        self.verify_crc = os.getenv('COPY_VERIFY_CRC', '').strip().lower() in ('1', 'true', 'si', 'sí')
         
         if not self.remote_base_dir or not self.local_db_dir:
             self.logger.error("[X] Error: REMOTE_BASE_DIR y LOCAL_DB_DIR deben estar definidos en .env")
@@ -28,16 +399,26 @@ class DBLocalImporter:
         # Crear directorio local si no existe
         os.makedirs(self.local_db_dir, exist_ok=True)
         
+        # Listados de directorio ya consultados (evita un STAT por red por fichero)
+        self._dir_cache = {}
+        
         self.databases = self._discover_databases()
+        
+        # Nombre de fichero remoto (en minúsculas) -> ruta local, para revincular tablas en O(1).
+        # Access no distingue mayúsculas en las rutas de los vínculos.
+        self._remote_basename_to_local = {
+            entry.filename.lower(): entry.local for entry in self.databases.values()
+        }
 
     def _setup_logging(self):
         """Configura el sistema de logging."""
-        self.logger = logging.getLogger('DBLocalImporter')
+        self.logger = logging.getLogger(LOGGER_NAME)
         self.logger.setLevel(logging.DEBUG)
         
         # Evitar duplicación de handlers si se reinicializa
         if self.logger.hasHandlers():
             self.logger.handlers.clear()
+        self._stop_log_listener()
             
         # Handler para la consola
         ch = logging.StreamHandler()
@@ -52,66 +433,164 @@ class DBLocalImporter:
         fh.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         fh.setFormatter(file_formatter)
-        self.logger.addHandler(fh)
         
-        self.logger.info(f"Logging configurado. Archivo de log en: {log_file_path}")
+        # La escritura a disco se hace en un hilo aparte: el llamador solo encola el registro
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._log_listener = logging.handlers.QueueListener(log_queue, fh, respect_handler_level=True)
+        self._log_listener.start()
+        atexit.register(self._stop_log_listener)
+        
+        self.logger.info("Logging configurado. Archivo de log en: %s", log_file_path)
+
+    def _stop_log_listener(self):
+        """Vacía la cola de logging y detiene el hilo escritor del archivo."""
+        listener = getattr(self, '_log_listener', None)
+        if listener is None:
+            return
+        self._log_listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+    def __getstate__(self):
+        # El hilo del listener no se puede enviar a los procesos de copia
+        state = self.__dict__.copy()
+        state['_log_listener'] = None
+        return state
 
     def _discover_databases(self) -> dict:
         """Descubre las bases de datos a importar desde las variables de entorno."""
+        # Una sola pasada filtrando por prefijo; DB_PASSWORD no es una base de datos
+        db_items = [
+            (key.lower(), value) for key, value in os.environ.items()
+            if key[:3] == 'DB_' and key != 'DB_PASSWORD'
+        ]
+        
         databases = {}
-        for key, value in os.environ.items():
-            if key.startswith('DB_') and key != 'DB_PASSWORD':
-                db_name = key.lower()
-                remote_path = value
-                
-                # Construir ruta local basada en el nombre de la base remota
-                local_filename = os.path.basename(remote_path)
-                local_path = os.path.join(self.local_db_dir, local_filename)
-                
-                databases[db_name] = (remote_path, local_path)
-                
-        self.logger.info(f"Descubiertas {len(databases)} bases de datos para procesar.")
+        for db_name, remote_path in db_items:
+            # Construir ruta local basada en el nombre de la base remota
+            local_filename = os.path.basename(remote_path)
+            local_path = os.path.join(self.local_db_dir, local_filename)
+            
+            databases[db_name] = DBEntry(
+                name=db_name,
+                remote=remote_path,
+                local=local_path,
+                filename=local_filename,
+                is_correos=db_name == 'db_correos'
+            )
+        
+        self.logger.info("Descubiertas %s bases de datos para procesar.", len(databases))
         return databases
 
     def show_configuration(self):
         """Muestra la configuración actual."""
         self.logger.info("=== Configuración Actual ===")
-        self.logger.info(f"Directorio base remoto: {self.remote_base_dir}")
-        self.logger.info(f"Directorio local de BD: {self.local_db_dir}")
-        self.logger.info(f"Contraseña de BD: {'Sí' if self.db_password else 'No'}")
+        self.logger.info("Directorio base remoto: %s", self.remote_base_dir)
+        self.logger.info("Directorio local de BD: %s", self.local_db_dir)
+        self.logger.info("Contraseña de BD: %s", 'Sí' if self.db_password else 'No')
+        self.logger.info("Verificación CRC: %s", 'Sí' if self.verify_crc else 'No')
         self.logger.info("Bases de datos a procesar:")
         
-        for db_name, (remote_path, local_path) in self.databases.items():
-            self.logger.info(f"  - {db_name}:")
-            self.logger.info(f"    Remoto: {remote_path}")
-            self.logger.info(f"    Local:  {local_path}")
+        for entry in self.databases.values():
+            self.logger.info("  - %s:", entry.name)
+            self.logger.info("    Remoto: %s", entry.remote)
+            self.logger.info("    Local:  %s", entry.local)
         self.logger.info("===========================")
 
+    def _exists_cached(self, path: str) -> bool:
+        """Comprueba si existe una ruta listando su directorio una sola vez."""
+        parent, name = os.path.split(path)
+        if not name:
+            return os.path.exists(path)
+        
+        if parent in self._dir_cache:
+            names = self._dir_cache[parent]
+        else:
+            names = self._list_directory(parent)
+        
+        if names is None:
+            return os.path.exists(path)
+        return os.path.normcase(name) in names
+
+    def _list_directory(self, parent: str):
+        """Lista un directorio y guarda sus nombres en la caché de existencia."""
+        try:
+            with os.scandir(parent or '.') as entries:
+                names = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            # Sin permiso de listado (o directorio inexistente): comprobar fichero a fichero
+            names = None
+        
+        self._dir_cache[parent] = names
+        return names
+
     def _check_network_accessibility(self) -> bool:
         """Verifica si las rutas de red remotas son accesibles."""
         self.logger.info("Verificando accesibilidad de red...")
         all_accessible = True
         
+        # Los sondeos de red son esperas de E/S independientes: se lanzan en paralelo
+        # para que el tiempo total sea el del más lento y no la suma de todos
+        with ThreadPoolExecutor(max_workers=min(16, len(self.databases) + 1)) as pool:
+            # Un único sondeo por recurso compartido: si no existe, sus bases se
+            # dan por inaccesibles sin esperar un timeout de red por cada directorio
+            parents = {os.path.dirname(entry.remote) for entry in self.databases.values()}
+            parents.add(os.path.dirname(self.remote_base_dir))
+            
+            shares = sorted({_unc_share(parent) for parent in parents} - {''})
+            probes = dict(zip(shares, pool.map(_probe_share, shares)))
+            for share, reachable in probes.items():
+                if reachable is False:
+                    self.logger.warning("  [!] Recurso de red no accesible: %s", share)
+                elif reachable is None:
+                    self.logger.debug("    [!] No se pudo sondear %s; se comprobará cada ruta", share)
+            
+            for parent in parents:
+                reachable = probes.get(_unc_share(parent), True)
+                if reachable is False:
+                    # Recurso inexistente (incluido el del directorio base): directorios vacíos
+                    self._dir_cache[parent] = set()
+                elif reachable is None:
+                    # Sin listado previo: _exists_cached comprobará las rutas reales
+                    self._dir_cache[parent] = None
+            
+            # Listar de una vez los directorios que aún no están en caché
+            list(pool.map(self._list_directory, parents - set(self._dir_cache)))
+        
         # Verificar directorio base
-        if not os.path.exists(self.remote_base_dir):
-            self.logger.error(f"[X] Directorio base remoto no accesible: {self.remote_base_dir}")
+        if not self._exists_cached(self.remote_base_dir):
+            self.logger.error("[X] Directorio base remoto no accesible: %s", self.remote_base_dir)
             all_accessible = False
         else:
-            self.logger.info(f"  [OK] Directorio base accesible: {self.remote_base_dir}")
+            self.logger.info("  [OK] Directorio base accesible: %s", self.remote_base_dir)
         
         # Verificar cada base de datos remota
-        for db_name, (remote_path, _) in self.databases.items():
-            if not os.path.exists(remote_path):
-                self.logger.warning(f"  [!] {db_name} - Ruta remota no accesible: {remote_path}")
+        for entry in self.databases.values():
+            if not self._exists_cached(entry.remote):
+                self.logger.warning("  [!] %s - Ruta remota no accesible: %s", entry.name, entry.remote)
                 # No marcamos como error fatal, puede que solo se quieran actualizar vínculos
             else:
-                self.logger.info(f"  [OK] {db_name} - Ruta remota accesible")
+                self.logger.info("  [OK] %s - Ruta remota accesible", entry.name)
                 
         return all_accessible
 
     def _check_access_availability(self) -> bool:
         """Verifica si la aplicación Microsoft Access está disponible."""
+        # Leer el registro es inmediato; Dispatch arranca msaccess.exe solo para comprobarlo
+        try:
+            import winreg
+            winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, r'Access.Application\CurVer').Close()
+            self.logger.info("[OK] Microsoft Access detectado.")
+            return True
+        except (ImportError, OSError) as e:
+            self.logger.debug("    Access no registrado en HKCR, se prueba vía COM: %s", e)
+        
         try:
+            import pythoncom
+            import win32com.client
+            
             pythoncom.CoInitialize()
             win32com.client.Dispatch("Access.Application")
             pythoncom.CoUninitialize()
@@ -119,7 +598,7 @@ class DBLocalImporter:
             return True
         except Exception as e:
             self.logger.error("[X] Error: Microsoft Access no parece estar instalado o accesible.")
-            self.logger.debug(f"    Detalles del error: {e}")
+            self.logger.debug("    Detalles del error: %s", e)
             return False
 
     def copy_databases(self) -> bool:
@@ -128,126 +607,311 @@ class DBLocalImporter:
         success_count = 0
         total_count = len(self.databases)
         
-        for db_name, (remote_path, local_path) in self.databases.items():
-            self.logger.info(f"Procesando {db_name}...")
-            
-            try:
-                if not os.path.exists(remote_path):
-                    self.logger.warning(f"  [SKIP] No se encontró la base remota: {remote_path}")
-                    continue
-                
-                # Lógica especial para DB_CORREOS
-                if db_name == 'db_correos':
-                    if self._setup_correos_database_light(remote_path, local_path):
-                        success_count += 1
-                    continue
-
-                # Lógica general para otras bases de datos
-                self.logger.info(f"  Copiando {remote_path} -> {local_path}")
-                shutil.copy2(remote_path, local_path)
-                self.logger.info(f"  [OK] Copia de {db_name} completada.")
+        simple_entries = []
+        correos_entries = []
+        
+        # Descartar las bases que no existen en remoto antes de repartir el trabajo
+        for entry in self.databases.values():
+            if not self._exists_cached(entry.remote):
+                self.logger.warning("[SKIP] %s - No se encontró la base remota: %s", entry.name, entry.remote)
+            elif entry.is_correos:
+                correos_entries.append(entry)
+            else:
+                simple_entries.append(entry)
+        
+        # Las copias por red están limitadas por la latencia: se solapan en hilos.
+        # La reconstrucción de correos (COM + ODBC) va en un proceso aparte para
+        # tener su propio apartamento COM y no bloquear el resto de copias.
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(simple_entries)))) as thread_pool, \
+                ProcessPoolExecutor(max_workers=max(1, min(2, len(correos_entries)))) as process_pool:
+            copy_futures = [thread_pool.submit(self._copy_simple, entry) for entry in simple_entries]
+            correos_futures = {
+                process_pool.submit(_copy_correos_worker, self, entry): entry
+                for entry in correos_entries
+            }
+            wait(copy_futures + list(correos_futures))
+        
+        for future in copy_futures:
+            if future.result():
                 success_count += 1
-                
+        
+        for future, entry in correos_futures.items():
+            try:
+                ok, records = future.result()
             except Exception as e:
-                self.logger.error(f"  [X] Error copiando {db_name}: {e}")
+                self.logger.error("  [X] Error copiando %s: %s", entry.name, e)
+                continue
+            
+            for record in records:
+                self.logger.handle(record)
+            if ok:
+                success_count += 1
         
-        self.logger.info(f"=== Copia finalizada: {success_count}/{total_count} exitosas ===")
+        self.logger.info("=== Copia finalizada: %s/%s exitosas ===", success_count, total_count)
         return success_count > 0
 
+    def _copy_simple(self, entry: DBEntry) -> bool:
+        """Copia una base de datos tal cual a su ubicación local."""
+        self.logger.info("Procesando %s...", entry.name)
+        
+        try:
+            if self._is_up_to_date(entry):
+                self.logger.info("  [OK] %s ya está actualizada, se omite la copia.", entry.name)
+                return True
+            
+            # Estado de la remota antes de copiar: si cambia durante la copia, se repetirá
+            remote_state = self._remote_state(entry)
+            self._remove_sync_record(entry)
+            
+            self.logger.info("  Copiando %s -> %s", entry.remote, entry.local)
+            _fast_copy(entry.remote, entry.local)
+            self._save_sync_record(entry, remote_state)
+            self.logger.info("  [OK] Copia de %s completada.", entry.name)
+            return True
+            
+        except Exception as e:
+            self.logger.error("  [X] Error copiando %s: %s", entry.name, e)
+            return False
+
+    def _is_up_to_date(self, entry: DBEntry) -> bool:
+        """Indica si la remota no ha cambiado desde la última copia local."""
+        if not os.path.exists(entry.local):
+            return False
+        try:
+            remote_stat = os.stat(entry.remote)
+        except FileNotFoundError:
+            return False
+        
+        # La copia local se modifica al revincular sus tablas: se compara la remota
+        # con su propio estado en el momento de la copia, no con el fichero local
+        record = self._load_sync_record(entry)
+        if record is None:
+            # Sin registro no hay copia completa que avalar (copia interrumpida o de una
+            # versión anterior): se copia de nuevo una vez y se guarda el registro
+            return False
+        
+        if (remote_stat.st_size != record.get('size')
+                or int(remote_stat.st_mtime) != record.get('mtime')):
+            return False
+        
+        if not self.verify_crc:
+            return True
+        
+        # Detecta cambios de contenido que no actualizaron la fecha de modificación
+        if record.get('crc') is None:
+            return False
+        try:
+            return _edge_crc32(entry.remote) == record['crc']
+        except OSError:
+            return False
+
+    def _remote_state(self, entry: DBEntry) -> dict:
+        """Tamaño, fecha y (si se verifica) CRC de los extremos de la base remota."""
+        remote_stat = os.stat(entry.remote)
+        return {
+            'size': remote_stat.st_size,
+            'mtime': int(remote_stat.st_mtime),
+            'crc': _edge_crc32(entry.remote) if self.verify_crc else None,
+        }
+
+    def _sync_record_path(self, entry: DBEntry) -> str:
+        """Ruta del fichero que guarda el estado de la remota en la última copia."""
+        return entry.local + '.sync'
+
+    def _load_sync_record(self, entry: DBEntry):
+        """Lee el estado guardado en la última copia, o None si no hay registro válido."""
+        try:
+            with open(self._sync_record_path(entry), 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return record if isinstance(record, dict) else None
+
+    def _save_sync_record(self, entry: DBEntry, remote_state: dict):
+        """Guarda el estado de la remota tras una copia correcta."""
+        try:
+            with open(self._sync_record_path(entry), 'w', encoding='utf-8') as f:
+                json.dump(remote_state, f)
+        except OSError as e:
+            # Sin registro la próxima ejecución simplemente vuelve a copiar
+            self.logger.debug("    [!] No se pudo guardar el registro de copia: %s", e)
+
+    def _remove_sync_record(self, entry: DBEntry):
+        """Elimina el registro antes de copiar para no dar por buena una copia a medias."""
+        try:
+            os.remove(self._sync_record_path(entry))
+        except FileNotFoundError:
+            pass
+
+    def _copy_correos(self, entry: DBEntry) -> bool:
+        """Genera la versión ligera de DB_CORREOS en lugar de copiarla entera."""
+        self.logger.info("Procesando %s...", entry.name)
+        
+        try:
+            return self._setup_correos_database_light(entry.remote, entry.local)
+            
+        except Exception as e:
+            self.logger.error("  [X] Error copiando %s: %s", entry.name, e)
+            return False
+
     def _setup_correos_database_light(self, remote_path: str, local_path: str) -> bool:
         """Crea una versión ligera de la base de datos de Correos."""
         self.logger.info("  [SPECIAL] Creando versión ligera de DB_CORREOS...")
+        source_copy = local_path + '.src'
+        source_conn = None
+        local_conn = None
         
         try:
             # Si ya existe, la eliminamos para recrearla
             if os.path.exists(local_path):
                 os.remove(local_path)
             
+            # El driver de Access es muy conversacional sobre SMB: es más rápido
+            # traer el fichero en una copia secuencial y leerlo en local
+            _fast_copy(remote_path, source_copy)
+            
+            # Una única conexión a la base de origen para analizar y leer registros
+            source_conn, main_table_name = self._open_access(source_copy)
+            if not main_table_name:
+                self.logger.error("  [X] No se encontró ninguna tabla de usuario en %s", remote_path)
+                return False
+            source_cursor = source_conn.cursor()
+            
+            # Analizar la estructura remota una sola vez para ambos pasos
+            table_structure = self._analyze_remote_table_structure(source_cursor, main_table_name)
+            if not table_structure:
+                return False
+            
             # Crear la base de datos vacía con la estructura correcta
-            if not self._create_empty_database_with_structure(remote_path, local_path):
+            local_conn = self._create_empty_database_with_structure(local_path, table_structure)
+            if local_conn is None:
                 return False
             
             # Llenar con los últimos registros
-            if not self._fill_database_with_latest_records(remote_path, local_path):
+            if not self._fill_database_with_latest_records(source_cursor, local_conn, table_structure):
                 return False
             
             self.logger.info("  [OK] Versión ligera de DB_CORREOS creada exitosamente.")
             return True
             
         except Exception as e:
-            self.logger.error(f"  [X] Error creando DB_CORREOS ligera: {e}")
+            self.logger.error("  [X] Error creando DB_CORREOS ligera: %s", e)
             return False
+        finally:
+            for conn in (local_conn, source_conn):
+                if conn is not None:
+                    conn.close()
+            # Un fallo al limpiar no invalida una base ya creada correctamente
+            try:
+                if os.path.exists(source_copy):
+                    os.remove(source_copy)
+            except OSError as e:
+                self.logger.warning("  [!] No se pudo eliminar la copia temporal %s: %s", source_copy, e)
+
+    def _odbc_connection_string(self, db_path: str) -> str:
+        """Construye la cadena de conexión ODBC para una base de datos Access."""
+        return f'DRIVER={ACCESS_ODBC_DRIVER};DBQ={db_path};PWD={self.db_password};'
+
+    def _open_access(self, db_path: str) -> tuple:
+        """
+        Abre una conexión ODBC a una base Access y localiza su tabla principal
+        
+        Returns:
+            tuple: (conexión pyodbc, nombre de la tabla principal o None)
+        """
+        pyodbc = _import_pyodbc()
+        
+        conn = pyodbc.connect(self._odbc_connection_string(db_path))
+        try:
+            return conn, self._find_main_table(conn.cursor())
+        except Exception:
+            conn.close()
+            raise
+
+    def _find_main_table(self, cursor) -> str:
+        """Devuelve la primera tabla de usuario (ni de sistema ni temporal)."""
+        try:
+            main_table = self._get_main_table(cursor)
+            if main_table:
+                return main_table
+            # Flags=0 excluye las tablas ocultas, que el catálogo ODBC sí devuelve
+            self.logger.debug("    [!] MSysObjects no devolvió ninguna tabla; se recorre el catálogo")
+        except Exception as e:
+            # Sin permiso de lectura sobre MSysObjects: recorrer el catálogo ODBC
+            self.logger.debug("    [!] No se pudo consultar MSysObjects: %s", e)
+        
+        for table in cursor.tables(tableType='TABLE'):
+            table_name = table.table_name
+            if not table_name.startswith('MSys') and not table_name.startswith('~'):
+                return table_name
+        return None
+
+    def _get_main_table(self, cursor) -> str:
+        """Obtiene la tabla principal con una única consulta a MSysObjects."""
+        row = cursor.execute(
+            "SELECT TOP 1 Name FROM MSysObjects "
+            "WHERE Type=1 AND Flags=0 AND Left(Name,4)<>'MSys' AND Left(Name,1)<>'~' "
+            # Mismo orden alfabético que el catálogo ODBC del método alternativo
+            "ORDER BY Name"
+        ).fetchone()
+        return row[0] if row else None
 
-    def _create_empty_database_with_structure(self, remote_path: str, local_path: str) -> bool:
-        """Crea una base de datos Access vacía con la misma estructura que la remota."""
+    def _create_empty_database_with_structure(self, local_path: str, table_structure: dict):
+        """
+        Crea una base de datos Access vacía con la estructura indicada
+        
+        Args:
+            local_path: Ruta de la base local a crear
+            table_structure: Estructura de la tabla principal (ver _analyze_remote_table_structure)
+        
+        Returns:
+            La conexión pyodbc abierta sobre la base local, o None si hubo errores
+        """
+        pyodbc = _import_pyodbc()
+        import pythoncom
+        import win32com.client
+        
+        local_path_abs = os.path.abspath(local_path)
+        filename = os.path.basename(local_path_abs)
+        
         pythoncom.CoInitialize()
+        catalog = None
         
         try:
-            filename = os.path.basename(local_path)
+            self.logger.info("  [BUILD] Creando base de datos %s desde cero...", filename)
             
-            self.logger.info(f"  [BUILD] Creando base de datos {filename} desde cero...")
-            
-            local_path_abs = os.path.abspath(local_path)
-            
-            # Paso 1: Crear base de datos vacía
-            access = win32com.client.Dispatch("Access.Application")
-            access.Visible = False
-            access.NewCurrentDatabase(local_path_abs)
-            access.Quit()
-            access = None
-            
-            # Paso 2: Aplicar contraseña
+            # Pasos 1 y 2: Crear base de datos vacía (y protegida) con ADOX,
+            # sin tener que arrancar Access
+            create_str = f"Provider=Microsoft.ACE.OLEDB.12.0;Data Source={local_path_abs};"
             if self.db_password:
-                self.logger.info(f"  [LOCK] Aplicando contraseña...")
-                access = win32com.client.Dispatch("Access.Application")
-                access.Visible = False
-                access.OpenCurrentDatabase(local_path_abs, True)
-                access.CurrentDb().NewPassword("", self.db_password)
-                access.CloseCurrentDatabase()
-                access.Quit()
-                access = None
-            
-            # Paso 3: Analizar estructura de la base remota
-            table_structure = self._analyze_remote_table_structure(remote_path)
+                self.logger.info("  [LOCK] Aplicando contraseña...")
+                create_str += f"Jet OLEDB:Database Password={self.db_password};"
             
-            if not table_structure:
-                return False
+            catalog = win32com.client.Dispatch("ADOX.Catalog")
+            catalog.Create(create_str)
+            # Liberar el fichero para poder abrirlo después con ODBC
+            catalog.ActiveConnection.Close()
             
-            # Paso 4: Crear tabla con la estructura analizada
-            if not self._create_table_with_structure(local_path_abs, table_structure):
-                return False
+            # Paso 3: Crear tabla con la estructura analizada
+            local_conn = pyodbc.connect(self._odbc_connection_string(local_path_abs))
+            if not self._create_table_with_structure(local_conn, table_structure):
+                local_conn.close()
+                return None
             
-            self.logger.info(f"  [OK] Base de datos {filename} creada exitosamente")
-            return True
+            self.logger.info("  [OK] Base de datos %s creada exitosamente", filename)
+            return local_conn
             
         except Exception as e:
-            self.logger.error(f"  [X] Error creando base de datos: {e}")
-            return False
+            self.logger.error("  [X] Error creando base de datos: %s", e)
+            return None
+        finally:
+            # Soltar el objeto COM antes de cerrar el apartamento
+            catalog = None
+            pythoncom.CoUninitialize()
     
-    def _analyze_remote_table_structure(self, remote_path: str) -> dict:
+    def _analyze_remote_table_structure(self, cursor, main_table_name: str) -> dict:
         """Analiza la estructura de la tabla principal en la base remota"""
-        import pyodbc
-        
         try:
-            driver = '{Microsoft Access Driver (*.mdb, *.accdb)}'
-            conn_str = f'DRIVER={driver};DBQ={remote_path};PWD={self.db_password};'
-            conn = pyodbc.connect(conn_str)
-            cursor = conn.cursor()
-            
-            # Encontrar la tabla principal
-            main_table_name = None
-            tables = cursor.tables(tableType='TABLE')
-            
-            for table in tables:
-                table_name = table.table_name
-                if not table_name.startswith('MSys') and not table_name.startswith('~'):
-                    main_table_name = table_name
-                    break
-            
-            if not main_table_name:
-                conn.close()
-                return None
-            
             # Obtener información de las columnas
             columns_info = []
             columns = cursor.columns(table=main_table_name)
@@ -256,32 +920,25 @@ class DBLocalImporter:
                 column_info = {
                     'name': col.column_name,
                     'type': col.type_name,
-                    'size': col.column_size if hasattr(col, 'column_size') else None,
-                    'nullable': col.nullable == 1 if hasattr(col, 'nullable') else True,
-                    'default': col.column_def if hasattr(col, 'column_def') else None
+                    'size': getattr(col, 'column_size', None),
+                    'nullable': getattr(col, 'nullable', 1) == 1,
+                    'default': getattr(col, 'column_def', None)
                 }
                 columns_info.append(column_info)
             
-            conn.close()
-            
             return {
                 'name': main_table_name,
                 'columns': columns_info
             }
             
         except Exception as e:
-            self.logger.error(f"  [X] Error analizando estructura remota: {e}")
+            self.logger.error("  [X] Error analizando estructura remota: %s", e)
             return None
     
-    def _create_table_with_structure(self, local_path: str, table_structure: dict) -> bool:
+    def _create_table_with_structure(self, local_conn, table_structure: dict) -> bool:
         """Crea una tabla en la base local con la estructura especificada"""
-        import pyodbc
-        
         try:
-            driver = '{Microsoft Access Driver (*.mdb, *.accdb)}'
-            conn_str = f'DRIVER={driver};DBQ={local_path};PWD={self.db_password};'
-            conn = pyodbc.connect(conn_str)
-            cursor = conn.cursor()
+            cursor = local_conn.cursor()
             
             table_name = table_structure['name']
             columns = table_structure['columns']
@@ -304,234 +961,169 @@ class DBLocalImporter:
             create_sql = f"CREATE TABLE [{table_name}] ({', '.join(column_definitions)})"
             
             cursor.execute(create_sql)
-            conn.commit()
-            conn.close()
+            local_conn.commit()
             
             return True
             
         except Exception as e:
-            self.logger.error(f"  [X] Error creando tabla: {e}")
+            self.logger.error("  [X] Error creando tabla: %s", e)
             return False
     
     def _map_odbc_type_to_access(self, odbc_type: str, size: int = None) -> str:
         """Mapea tipos de datos ODBC a tipos de Access SQL"""
-        type_mapping = {
-            'COUNTER': 'AUTOINCREMENT',
-            'INTEGER': 'INTEGER',
-            'LONG': 'LONG',
-            'SINGLE': 'SINGLE',
-            'DOUBLE': 'DOUBLE',
-            'CURRENCY': 'CURRENCY',
-            'DATETIME': 'DATETIME',
-            'BIT': 'YESNO',
-            'BYTE': 'BYTE',
-            'LONGBINARY': 'LONGBINARY',
-            'LONGTEXT': 'MEMO'
-        }
+        odbc_type = odbc_type.upper()
         
-        if odbc_type in ['VARCHAR', 'CHAR', 'TEXT']:
-            if size and size > 0:
-                return f"TEXT({size})"
-            else:
-                return "TEXT(255)"
+        if odbc_type in _TEXT_TYPES:
+            return f"TEXT({size})" if size and size > 0 else "TEXT(255)"
         
-        return type_mapping.get(odbc_type.upper(), "TEXT(255)")
+        return _TYPE_MAPPING.get(odbc_type, "TEXT(255)")
     
-    def _fill_database_with_latest_records(self, remote_path: str, local_path: str) -> bool:
+    def _fill_database_with_latest_records(self, remote_cursor, local_conn, table_structure: dict) -> bool:
         """Llena la base local con los últimos 5 registros de la base remota"""
-        import pyodbc
-        
         try:
-            self.logger.info(f"  [DATA] Obteniendo últimos 5 registros...")
-            
-            driver = '{Microsoft Access Driver (*.mdb, *.accdb)}'
+            self.logger.info("  [DATA] Obteniendo últimos 5 registros...")
             
-            # Conectar a la base remota
-            remote_conn_str = f'DRIVER={driver};DBQ={remote_path};PWD={self.db_password};'
-            remote_conn = pyodbc.connect(remote_conn_str)
-            remote_cursor = remote_conn.cursor()
-            
-            # Obtener la tabla principal
-            main_table_name = None
-            tables = remote_cursor.tables(tableType='TABLE')
-            
-            for table in tables:
-                table_name = table.table_name
-                if not table_name.startswith('MSys') and not table_name.startswith('~'):
-                    main_table_name = table_name
-                    break
-            
-            if not main_table_name:
-                remote_conn.close()
-                return True
-            
-            # Obtener columnas
-            columns_info = remote_cursor.columns(table=main_table_name)
-            column_names = [col.column_name for col in columns_info]
+            # Tabla principal y columnas ya obtenidas al analizar la estructura
+            main_table_name = table_structure['name']
+            column_names = [col['name'] for col in table_structure['columns']]
             
             # Intentar obtener los últimos 5 registros
             order_fields = ['ID', 'Id', 'id', 'Fecha', 'fecha', 'FechaCreacion', 'Timestamp']
-            records = []
-            
-            for field in order_fields:
-                if field in column_names:
-                    try:
-                        sql = f"SELECT TOP 5 * FROM [{main_table_name}] ORDER BY [{field}] DESC"
-                        remote_cursor.execute(sql)
-                        records = remote_cursor.fetchall()
-                        if records:
-                            break
-                    except:
-                        continue
-            
-            if not records:
+            available = set(column_names)
+            candidates = [field for field in order_fields if field in available]
+            executed = False
+            
+            # Elegir el campo de ordenación en Python: como mucho una consulta ordenada
+            if candidates:
+                try:
+                    sql = f"SELECT TOP 5 * FROM [{main_table_name}] ORDER BY [{candidates[0]}] DESC"
+                    remote_cursor.execute(sql)
+                    executed = True
+                except:
+                    pass
+            
+            if not executed:
                 # Si no se pudo ordenar, tomar los primeros 5
                 try:
                     sql = f"SELECT TOP 5 * FROM [{main_table_name}]"
                     remote_cursor.execute(sql)
-                    records = remote_cursor.fetchall()
+                    executed = True
                 except:
                     pass
             
-            remote_conn.close()
-            
-            if not records:
-                self.logger.info(f"  [OK] No hay registros para copiar")
+            if not executed:
+                self.logger.info("  [OK] No hay registros para copiar")
                 return True
             
             # Insertar registros en la base local
-            local_conn_str = f'DRIVER={driver};DBQ={local_path};PWD={self.db_password};'
-            local_conn = pyodbc.connect(local_conn_str)
             local_cursor = local_conn.cursor()
+            local_cursor.fast_executemany = True
             
             # Construir INSERT
             placeholders = ', '.join(['?' for _ in column_names])
             insert_sql = f"INSERT INTO [{main_table_name}] ([{'], ['.join(column_names)}]) VALUES ({placeholders})"
             
-            for record in records:
-                try:
-                    local_cursor.execute(insert_sql, record)
-                except Exception as e:
-                    self.logger.debug(f"    [!] Error insertando registro: {e}")
+            # Leer e insertar por lotes en lugar de cargar todo el resultado en memoria
+            fetched = 0
+            inserted = 0
+            while True:
+                batch = remote_cursor.fetchmany(FETCH_BATCH_SIZE)
+                if not batch:
+                    break
+                fetched += len(batch)
+                inserted += self._insert_batch(local_conn, local_cursor, insert_sql, batch)
             
-            local_conn.commit()
-            local_conn.close()
+            if not fetched:
+                self.logger.info("  [OK] No hay registros para copiar")
+                return True
             
-            self.logger.info(f"  [OK] Insertados {len(records)} registros")
+            self.logger.info("  [OK] Insertados %s registros", inserted)
             return True
             
         except Exception as e:
-            self.logger.error(f"  [X] Error llenando base con registros: {e}")
+            self.logger.error("  [X] Error llenando base con registros: %s", e)
             return False
     
+    def _insert_batch(self, local_conn, local_cursor, insert_sql: str, records) -> int:
+        """Inserta un lote de registros y devuelve cuántos se insertaron"""
+        rows = [tuple(record) for record in records]
+        
+        # Un único envío de parámetros en lugar de una ida y vuelta por fila
+        try:
+            local_cursor.executemany(insert_sql, rows)
+            local_conn.commit()
+            return len(rows)
+        except Exception as e:
+            # Repetir fila a fila solo para salvar las válidas y registrar las que fallan
+            self.logger.debug("    [!] Error insertando el lote: %s", e)
+            local_conn.rollback()
+        
+        # Mismo cursor y misma sentencia: pyodbc reutiliza el plan preparado en cada fila
+        inserted = 0
+        for row in rows:
+            try:
+                local_cursor.execute(insert_sql, row)
+                inserted += 1
+            except Exception as row_error:
+                self.logger.debug("    [!] Error insertando registro: %s", row_error)
+        
+        local_conn.commit()
+        return inserted
+    
     def update_all_database_links(self) -> bool:
         """Actualiza vínculos en todas las bases de datos locales"""
         self.logger.info("=== Iniciando actualización de vínculos ===")
         success_count = 0
-        total_count = 0
+        db_items = []
+        
+        # La copia acaba de modificar el directorio local: volver a listarlo una sola vez
+        for local_dir in {os.path.dirname(entry.local) for entry in self.databases.values()}:
+            self._dir_cache.pop(local_dir, None)
         
-        for db_name, (remote_path, local_path) in self.databases.items():
-            if not os.path.exists(local_path):
-                self.logger.warning(f"[SKIP] {db_name} - Base local no existe: {local_path}")
+        for entry in self.databases.values():
+            if not self._exists_cached(entry.local):
+                self.logger.warning("[SKIP] %s - Base local no existe: %s", entry.name, entry.local)
                 continue
             
-            total_count += 1
-            
-            try:
-                self.logger.info(f"[LINK] Actualizando vínculos en {db_name}...")
-                
-                if self._update_database_links(local_path):
-                    self.logger.info(f"  [OK] Vínculos actualizados en {db_name}")
-                    success_count += 1
-                else:
-                    self.logger.error(f"  [X] Error actualizando vínculos en {db_name}")
-                    
-            except Exception as e:
-                self.logger.error(f"[X] Error procesando vínculos en {db_name}: {e}")
+            db_items.append((entry.name, entry.local))
         
-        self.logger.info(f"=== Actualización de vínculos completada: {success_count}/{total_count} exitosas ===")
-        return success_count == total_count
-    
-    def _update_database_links(self, db_path: str) -> bool:
-        """Actualiza los vínculos de una base de datos específica"""
-        try:
-            pythoncom.CoInitialize()
-            
-            access = win32com.client.Dispatch("Access.Application")
-            access.Visible = False
-            
-            # Abrir base de datos
-            if self.db_password:
-                access.OpenCurrentDatabase(db_path, False, self.db_password)
-            else:
-                access.OpenCurrentDatabase(db_path)
-            
-            db = access.CurrentDb()
-            table_defs = db.TableDefs
+        total_count = len(db_items)
+        
+        if db_items:
+            # Access es COM de apartamento único: se paraleliza con procesos, no con hilos.
+            # Cada proceso recibe un lote y reutiliza una única instancia de Access.
+            worker_count = min(4, total_count)
+            tasks = [
+                (db_items[i::worker_count], self.db_password, self._remote_basename_to_local, self.local_db_dir)
+                for i in range(worker_count)
+            ]
             
-            updated_count = 0
+            # Con un único lote no compensa lanzar un proceso: se procesa aquí mismo
+            pool = multiprocessing.Pool(processes=worker_count) if worker_count > 1 else None
             
-            for i in range(table_defs.Count):
-                table_def = table_defs.Item(i)
-                table_name = table_def.Name
+            try:
+                if pool is not None:
+                    batches = pool.imap_unordered(_update_links_worker, tasks)
+                else:
+                    batches = map(_update_links_worker, tasks)
                 
-                # Solo procesar tablas vinculadas
-                if hasattr(table_def, 'Connect') and table_def.Connect:
-                    connect_str = table_def.Connect
+                for results, records in batches:
+                    for record in records:
+                        self.logger.handle(record)
                     
-                    if 'DATABASE=' in connect_str.upper():
-                        # Extraer la ruta actual
-                        parts = connect_str.split(';')
-                        current_db_path = None
-                        
-                        for part in parts:
-                            if part.upper().startswith('DATABASE='):
-                                current_db_path = part[9:]  # Remover 'DATABASE='
-                                break
-                        
-                        if current_db_path:
-                            # Convertir a ruta local
-                            new_local_path = self._convert_to_local_path(current_db_path)
-                            
-                            if new_local_path and os.path.exists(new_local_path):
-                                try:
-                                    # Actualizar el vínculo
-                                    new_connect_str = connect_str.replace(current_db_path, new_local_path)
-                                    table_def.Connect = new_connect_str
-                                    table_def.RefreshLink()
-                                    
-                                    self.logger.debug(f"    [OK] Tabla {table_name} revinculada")
-                                    updated_count += 1
-                                    
-                                except Exception as e:
-                                    self.logger.debug(f"    [X] Error revinculando {table_name}: {e}")
-            
-            access.CloseCurrentDatabase()
-            access.Quit()
-            access = None
+                    success_count += sum(1 for _, ok in results if ok)
+            except BaseException:
+                if pool is not None:
+                    pool.terminate()
+                raise
             
-            self.logger.info(f"  [OK] {updated_count} tablas revinculadas")
-            return True
-            
-        except Exception as e:
-            import traceback
-            self.logger.error(f"  [X] Error actualizando vínculos: {e}")
-            self.logger.debug(traceback.format_exc())
-            return False
-        finally:
-            pythoncom.CoUninitialize()
-    
-    def _convert_to_local_path(self, remote_path: str) -> str:
-        """Convierte una ruta remota a su equivalente local"""
-        filename = os.path.basename(remote_path)
+            if pool is not None:
+                # Salida normal: dejar que cada proceso termine de cerrar su Access
+                pool.close()
+                pool.join()
         
-        # Buscar en nuestras bases de datos configuradas
-        for db_name, (configured_remote, configured_local) in self.databases.items():
-            if os.path.basename(configured_remote) == filename:
-                return configured_local
-        
-        # Si no se encuentra, asumir que está en el directorio local
-        return os.path.join(self.local_db_dir, filename)
+        self.logger.info("=== Actualización de vínculos completada: %s/%s exitosas ===", success_count, total_count)
+        return success_count == total_count
     
     def setup_environment(self, force_links_only: bool = False) -> bool:
         """
@@ -583,7 +1175,7 @@ class DBLocalImporter:
                 return False
                 
         except Exception as e:
-            self.logger.error(f"[X] Error en importación: {e}")
+            self.logger.error("[X] Error en importación: %s", e)
             return False
 
 def main():